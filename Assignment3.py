@@ -1,35 +1,111 @@
+import atexit
+import csv
+import os
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+
+try:
+    import readline
+except ImportError:
+    readline = None
+
+@dataclass(slots=True, frozen=True)
+class Student:
+    last: str
+    first: str
+    major: str
+    gpa: str
+
+HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".student_search_history")
+HISTORY_LENGTH = 500
+
+def enable_history():
+    if readline is None:
+        return
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    atexit.register(save_history)
+
+def save_history():
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+def forget_last_input(text):
+    # Keep menu choices out of the history so recall only shows search terms
+    if readline is None:
+        return
+    length = readline.get_current_history_length()
+    if length and readline.get_history_item(length) == text:
+        readline.remove_history_item(length - 1)
+
 def load_students(filename):
     students = {}
+    by_last = defaultdict(list)
+    by_major = defaultdict(list)
     try:
-        with open(filename, 'r') as file:
-            for line in file:
-                studentId, lastName, firstName, major, gpa = line.strip().split(',')
-                students[studentId] = [lastName, firstName, major, gpa]
+        with open(filename, 'r', buffering=1 << 20, newline='') as file:
+            for row in csv.reader(file):
+                # Skip blank or malformed lines instead of aborting the load
+                if len(row) != 5:
+                    continue
+                studentId, lastName, firstName, major, gpa = row
+                # A repeated ID replaces the earlier record, so unindex that one first
+                old = students.get(studentId)
+                if old is not None:
+                    by_last[old.last.casefold()].remove(studentId)
+                    by_major[old.major.casefold()].remove(studentId)
+                major = sys.intern(major)
+                students[studentId] = Student(lastName, firstName, major, gpa)
+                by_last[lastName.casefold()].append(studentId)
+                by_major[major.casefold()].append(studentId)
     except FileNotFoundError:
         print("File not found.")
-    return students
-
-def search_by_last_name(students, last_name):
-    found = False
-    for studentId, info in students.items():
-        if info[0].lower() == last_name.lower():
-            print(f"{studentId},{info[0]},{info[1]},{info[2]},{info[3]}")
-            found = True
-    if not found:
+    return students, by_last, by_major
+
+def format_student(studentId, info):
+    return f"{studentId},{info.last},{info.first},{info.major},{info.gpa}"
+
+def find_ids(index, sorted_keys, query):
+    key = query.casefold()
+    if not key.endswith('*'):
+        return index.get(key, ())
+    # Prefix search: matching keys sit next to each other in sorted order
+    prefix = key[:-1]
+    ids = []
+    i = bisect_left(sorted_keys, prefix)
+    while i < len(sorted_keys) and sorted_keys[i].startswith(prefix):
+        ids.extend(index[sorted_keys[i]])
+        i += 1
+    return ids
+
+def search_by_last_name(students, by_last, last_keys, last_name):
+    matches = [format_student(studentId, students[studentId])
+               for studentId in find_ids(by_last, last_keys, last_name)]
+    if matches:
+        sys.stdout.write('\n'.join(matches) + '\n')
+    else:
         print("No students found with that last name.")
 
-def search_by_major(students, major):
-    found = False
-    for studentId, info in students.items():
-        if info[2].lower() == major.lower():
-            print(f"{studentId},{info[0]},{info[1]},{info[2]},{info[3]}")
-            found = True
-    if not found:
+def search_by_major(students, by_major, major_keys, major):
+    matches = [format_student(studentId, students[studentId])
+               for studentId in find_ids(by_major, major_keys, major)]
+    if matches:
+        sys.stdout.write('\n'.join(matches) + '\n')
+    else:
         print("No students found with that major.")
 
 def main():
     filename = "students.txt"
-    students = load_students(filename)
+    students, by_last, by_major = load_students(filename)
+    last_keys, major_keys = sorted(by_last), sorted(by_major)
+    enable_history()
 
     while True:
         print("\nChoose an option:")
@@ -37,13 +113,14 @@ def main():
         print("2) Search by Major")
         print("3) Quit")
         choice = input("Enter your choice: ")
+        forget_last_input(choice)
 
         if choice == '1':
-            last_name = input("Enter last name to search for: ")
-            search_by_last_name(students, last_name)
+            last_name = input("Enter last name to search for (end with * to match a prefix): ")
+            search_by_last_name(students, by_last, last_keys, last_name)
         elif choice == '2':
-            major = input("Enter major to search for: ")
-            search_by_major(students, major)
+            major = input("Enter major to search for (end with * to match a prefix): ")
+            search_by_major(students, by_major, major_keys, major)
         elif choice == '3':
             print("Exiting program.")
             break
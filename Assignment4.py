@@ -1,34 +1,124 @@
+import json
+import os
+import time
 import requests
 
-def main():
-    url = "https://api.weather.gov/points/40.1934,-85.3864"
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+LAT_LON = "40.1934,-85.3864"
+CACHE_FILE = os.path.expanduser("~/.cache/weather_gov_points.json")
+CACHE_TTL = 7 * 24 * 60 * 60
 
+def read_cache():
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        with open(CACHE_FILE, 'r') as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
 
-        forecast_url = data['properties']['forecast']
-        print(f"Forecast URL: {forecast_url}")
-    except Exception as e:
-        print(f"Failed to retrieve forecast URL: {e}")
-        return
+def write_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, 'w') as file:
+            json.dump(cache, file)
+    except OSError:
+        pass
 
+def load_cached_forecast_url(lat_lon):
+    entry = read_cache().get(lat_lon)
     try:
-        forecast_response = requests.get(forecast_url)
-        forecast_response.raise_for_status()
-        forecast_data = forecast_response.json()
-
-        periods = forecast_data['properties']['periods']
-        print("\n7-Day Forecast for Muncie, IN:\n")
-        for period in periods:
-            name = period['name']
-            temp = period['temperature']
-            forecast = period['detailedForecast']
-            print(f"{name}: {temp}°F\n{forecast}\n")
+        if time.time() - entry['saved'] < CACHE_TTL:
+            return entry['url']
+    except (TypeError, KeyError):
+        pass
+    return None
 
+def save_cached_forecast_url(lat_lon, forecast_url):
+    cache = read_cache()
+    cache[lat_lon] = {'url': forecast_url, 'saved': time.time()}
+    write_cache(cache)
+
+def drop_cached_forecast_url(lat_lon):
+    cache = read_cache()
+    if cache.pop(lat_lon, None) is not None:
+        write_cache(cache)
+
+def fetch_forecast_url(session, url):
+    if ijson is not None:
+        # Stream the /points response and stop parsing once the forecast URL is found
+        with session.get(url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            try:
+                forecast_url = next(ijson.items(response.raw, 'properties.forecast'))
+            except (ijson.JSONError, StopIteration):
+                forecast_url = None
+            # Drain the rest so the connection stays reusable for the forecast request
+            response.raw.read()
+        if forecast_url is not None:
+            return forecast_url
+
+    response = session.get(url)
+    response.raise_for_status()
+    data = response.json()
+    return data['properties']['forecast']
+
+def main():
+    with requests.Session() as session:
+        show_forecast(session)
+
+def show_forecast(session):
+    forecast_url = load_cached_forecast_url(LAT_LON)
+    from_cache = forecast_url is not None
+    if not from_cache:
+        forecast_url = resolve_forecast_url(session)
+        if forecast_url is None:
+            return
+
+    try:
+        periods = fetch_periods(session, forecast_url)
     except Exception as e:
-        print(f"Failed to retrieve forecast data: {e}")
+        if not from_cache:
+            print(f"Failed to retrieve forecast data: {e}")
+            return
+        # The cached URL may be stale, so look it up again once
+        drop_cached_forecast_url(LAT_LON)
+        forecast_url = resolve_forecast_url(session)
+        if forecast_url is None:
+            return
+        try:
+            periods = fetch_periods(session, forecast_url)
+        except Exception as e:
+            print(f"Failed to retrieve forecast data: {e}")
+            return
+
+    print(f"Forecast URL: {forecast_url}")
+    print("\n7-Day Forecast for Muncie, IN:\n")
+    for period in periods:
+        name = period['name']
+        temp = period['temperature']
+        forecast = period['detailedForecast']
+        print(f"{name}: {temp}°F\n{forecast}\n")
+
+def resolve_forecast_url(session):
+    url = f"https://api.weather.gov/points/{LAT_LON}"
+    try:
+        forecast_url = fetch_forecast_url(session, url)
+    except Exception as e:
+        print(f"Failed to retrieve forecast URL: {e}")
+        return None
+    save_cached_forecast_url(LAT_LON, forecast_url)
+    return forecast_url
+
+def fetch_periods(session, forecast_url):
+    forecast_response = session.get(forecast_url)
+    forecast_response.raise_for_status()
+    forecast_data = forecast_response.json()
+    return forecast_data['properties']['periods']
 
 if __name__ == "__main__":
     main()
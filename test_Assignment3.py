@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from Assignment3 import load_students, find_ids, search_by_last_name, search_by_major
+
+ROSTER = """001,Smith,Alice,Chemistry,3.7
+002,Smithers,Waylon,Mathematics,3.1
+
+003,Jones,Bob,Mathematics,2.8
+004,Short,Row
+005,Ng,Chris,Computer Science,3.9
+"""
+
+class TestAssignment3(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, 'w') as file:
+            file.write(ROSTER)
+        self.students, self.by_last, self.by_major = load_students(self.filename)
+        self.last_keys, self.major_keys = sorted(self.by_last), sorted(self.by_major)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def search_output(self, search, index, keys, query):
+        output = StringIO()
+        with redirect_stdout(output):
+            search(self.students, index, keys, query)
+        return output.getvalue()
+
+    def test_load_skips_blank_and_short_rows(self):
+        self.assertEqual(sorted(self.students), ['001', '002', '003', '005'])
+
+    def test_load_repeated_id_replaces_record(self):
+        with open(self.filename, 'a') as file:
+            file.write("001,Brown,Alice,Physics,3.5\n")
+        students, by_last, by_major = load_students(self.filename)
+        self.assertEqual(students['001'].last, 'Brown')
+        self.assertEqual(list(find_ids(by_last, sorted(by_last), 'smith')), [])
+        self.assertEqual(list(find_ids(by_major, sorted(by_major), 'physics')), ['001'])
+
+    def test_exact_search(self):
+        self.assertEqual(list(find_ids(self.by_last, self.last_keys, 'Smith')), ['001'])
+        self.assertEqual(list(find_ids(self.by_major, self.major_keys, 'Mathematics')), ['002', '003'])
+
+    def test_search_is_case_insensitive(self):
+        self.assertEqual(list(find_ids(self.by_last, self.last_keys, 'sMITH')), ['001'])
+        self.assertEqual(list(find_ids(self.by_major, self.major_keys, 'computer science')), ['005'])
+
+    def test_prefix_search(self):
+        self.assertEqual(find_ids(self.by_last, self.last_keys, 'smi*'), ['001', '002'])
+        self.assertEqual(find_ids(self.by_major, self.major_keys, 'C*'), ['001', '005'])
+
+    def test_prefix_search_star_only_matches_everyone(self):
+        self.assertEqual(sorted(find_ids(self.by_last, self.last_keys, '*')), ['001', '002', '003', '005'])
+
+    def test_no_match(self):
+        self.assertEqual(list(find_ids(self.by_last, self.last_keys, 'Smit')), [])
+        self.assertEqual(find_ids(self.by_last, self.last_keys, 'Z*'), [])
+
+    def test_search_output(self):
+        output = self.search_output(search_by_last_name, self.by_last, self.last_keys, 'smith')
+        self.assertEqual(output, "001,Smith,Alice,Chemistry,3.7\n")
+        output = self.search_output(search_by_major, self.by_major, self.major_keys, 'math*')
+        self.assertEqual(output, "002,Smithers,Waylon,Mathematics,3.1\n003,Jones,Bob,Mathematics,2.8\n")
+
+    def test_search_output_no_match(self):
+        output = self.search_output(search_by_last_name, self.by_last, self.last_keys, 'Davis')
+        self.assertEqual(output, "No students found with that last name.\n")
+        output = self.search_output(search_by_major, self.by_major, self.major_keys, 'Art*')
+        self.assertEqual(output, "No students found with that major.\n")
+
+if __name__ == '__main__':
+    unittest.main()
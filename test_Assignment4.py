@@ -0,0 +1,184 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import MagicMock, patch
+import Assignment4
+from Assignment4 import LAT_LON, fetch_forecast_url, show_forecast, load_cached_forecast_url, save_cached_forecast_url
+
+POINTS_URL = f"https://api.weather.gov/points/{LAT_LON}"
+FRESH_URL = "https://api.weather.gov/gridpoints/IND/1,2/forecast"
+STALE_URL = "https://api.weather.gov/gridpoints/IND/9,9/forecast"
+PERIODS = [{'name': 'Tonight', 'temperature': 50, 'detailedForecast': 'Clear.'}]
+
+def make_response(data=None, error=None):
+    response = MagicMock()
+    if error is not None:
+        response.raise_for_status.side_effect = error
+    response.json.return_value = data
+    return response
+
+class TestAssignment4(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.cache_dir, 'cache', 'points.json')
+        patcher = patch.object(Assignment4, 'CACHE_FILE', self.cache_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(Assignment4, 'ijson', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def make_session(self, responses):
+        session = MagicMock()
+        session.get.side_effect = lambda url, **kwargs: responses[url].pop(0)
+        return session
+
+    def write_cache(self, entry):
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        with open(self.cache_file, 'w') as file:
+            json.dump({LAT_LON: entry}, file)
+
+    def run_forecast(self, session):
+        output = StringIO()
+        with redirect_stdout(output):
+            show_forecast(session)
+        return output.getvalue()
+
+    def requested_urls(self, session):
+        return [call.args[0] for call in session.get.call_args_list]
+
+    def test_cache_round_trip(self):
+        self.assertIsNone(load_cached_forecast_url(LAT_LON))
+        save_cached_forecast_url(LAT_LON, FRESH_URL)
+        self.assertEqual(load_cached_forecast_url(LAT_LON), FRESH_URL)
+
+    def test_fresh_cache_hit_skips_points(self):
+        self.write_cache({'url': FRESH_URL, 'saved': time.time()})
+        session = self.make_session({FRESH_URL: [make_response({'properties': {'periods': PERIODS}})]})
+        output = self.run_forecast(session)
+        self.assertEqual(self.requested_urls(session), [FRESH_URL])
+        self.assertIn("Tonight: 50°F", output)
+
+    def test_missing_cache_resolves_and_saves(self):
+        session = self.make_session({
+            POINTS_URL: [make_response({'properties': {'forecast': FRESH_URL}})],
+            FRESH_URL: [make_response({'properties': {'periods': PERIODS}})],
+        })
+        self.run_forecast(session)
+        self.assertEqual(self.requested_urls(session), [POINTS_URL, FRESH_URL])
+        self.assertEqual(load_cached_forecast_url(LAT_LON), FRESH_URL)
+
+    def test_expired_entry_is_refetched(self):
+        self.write_cache({'url': STALE_URL, 'saved': time.time() - Assignment4.CACHE_TTL - 1})
+        session = self.make_session({
+            POINTS_URL: [make_response({'properties': {'forecast': FRESH_URL}})],
+            FRESH_URL: [make_response({'properties': {'periods': PERIODS}})],
+        })
+        self.run_forecast(session)
+        self.assertEqual(self.requested_urls(session), [POINTS_URL, FRESH_URL])
+        self.assertEqual(load_cached_forecast_url(LAT_LON), FRESH_URL)
+
+    def test_old_format_entry_is_refetched(self):
+        self.write_cache(STALE_URL)
+        session = self.make_session({
+            POINTS_URL: [make_response({'properties': {'forecast': FRESH_URL}})],
+            FRESH_URL: [make_response({'properties': {'periods': PERIODS}})],
+        })
+        self.run_forecast(session)
+        self.assertEqual(self.requested_urls(session), [POINTS_URL, FRESH_URL])
+
+    def test_stale_cached_url_is_dropped_and_resolved_once(self):
+        self.write_cache({'url': STALE_URL, 'saved': time.time()})
+        session = self.make_session({
+            STALE_URL: [make_response(error=Exception("404 Not Found"))],
+            POINTS_URL: [make_response({'properties': {'forecast': FRESH_URL}})],
+            FRESH_URL: [make_response({'properties': {'periods': PERIODS}})],
+        })
+        output = self.run_forecast(session)
+        self.assertEqual(self.requested_urls(session), [STALE_URL, POINTS_URL, FRESH_URL])
+        self.assertEqual(output.count("Forecast URL:"), 1)
+        self.assertIn(f"Forecast URL: {FRESH_URL}", output)
+        self.assertNotIn("Failed", output)
+        self.assertEqual(load_cached_forecast_url(LAT_LON), FRESH_URL)
+
+    def test_second_failure_prints_once_and_gives_up(self):
+        self.write_cache({'url': STALE_URL, 'saved': time.time()})
+        session = self.make_session({
+            STALE_URL: [make_response(error=Exception("404 Not Found"))],
+            POINTS_URL: [make_response({'properties': {'forecast': FRESH_URL}})],
+            FRESH_URL: [make_response(error=Exception("500 Server Error"))],
+        })
+        output = self.run_forecast(session)
+        self.assertEqual(self.requested_urls(session), [STALE_URL, POINTS_URL, FRESH_URL])
+        self.assertEqual(output, "Failed to retrieve forecast data: 500 Server Error\n")
+
+class TestFetchForecastUrl(unittest.TestCase):
+
+    def fake_ijson(self, items):
+        class JSONError(Exception):
+            pass
+
+        fake = MagicMock()
+        fake.JSONError = JSONError
+        fake.items.side_effect = items
+        return fake
+
+    def make_session(self, streamed):
+        streamed.__enter__.return_value = streamed
+        full = make_response({'properties': {'forecast': FRESH_URL}})
+        session = MagicMock()
+        session.get.side_effect = lambda url, stream=False: streamed if stream else full
+        return session
+
+    def test_streamed_key_found(self):
+        streamed = make_response()
+        session = self.make_session(streamed)
+        fake_ijson = self.fake_ijson(lambda raw, prefix: iter([FRESH_URL]))
+        with patch.object(Assignment4, 'ijson', fake_ijson):
+            self.assertEqual(fetch_forecast_url(session, POINTS_URL), FRESH_URL)
+        session.get.assert_called_once_with(POINTS_URL, stream=True)
+        fake_ijson.items.assert_called_once_with(streamed.raw, 'properties.forecast')
+        streamed.raw.read.assert_called_once_with()
+
+    def test_parse_error_falls_back_to_full_parse(self):
+        streamed = make_response()
+        session = self.make_session(streamed)
+        fake_ijson = self.fake_ijson(None)
+        fake_ijson.items.side_effect = fake_ijson.JSONError("lexical error")
+        with patch.object(Assignment4, 'ijson', fake_ijson):
+            self.assertEqual(fetch_forecast_url(session, POINTS_URL), FRESH_URL)
+        self.assertEqual(session.get.call_args_list[0].kwargs, {'stream': True})
+        self.assertEqual(session.get.call_args_list[1].args, (POINTS_URL,))
+        self.assertEqual(session.get.call_args_list[1].kwargs, {})
+        self.assertEqual(session.get.call_count, 2)
+        streamed.raw.read.assert_called_once_with()
+
+    def test_missing_key_falls_back_to_full_parse(self):
+        streamed = make_response()
+        session = self.make_session(streamed)
+        fake_ijson = self.fake_ijson(lambda raw, prefix: iter([]))
+        with patch.object(Assignment4, 'ijson', fake_ijson):
+            self.assertEqual(fetch_forecast_url(session, POINTS_URL), FRESH_URL)
+        self.assertEqual(session.get.call_count, 2)
+        self.assertEqual(session.get.call_args_list[1].kwargs, {})
+
+    def test_http_error_is_not_retried(self):
+        streamed = make_response(error=Exception("503 Service Unavailable"))
+        session = self.make_session(streamed)
+        fake_ijson = self.fake_ijson(lambda raw, prefix: iter([FRESH_URL]))
+        with patch.object(Assignment4, 'ijson', fake_ijson):
+            with self.assertRaises(Exception):
+                fetch_forecast_url(session, POINTS_URL)
+        session.get.assert_called_once_with(POINTS_URL, stream=True)
+
+if __name__ == '__main__':
+    unittest.main()
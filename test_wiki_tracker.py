@@ -1,12 +1,14 @@
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
+import asyncio
+import os
 import sys
 import json
 from io import StringIO
 import requests
 
 try:
-    from wiki_tracker import WikipediaEditTracker, main
+    from wiki_tracker import WikipediaEditTracker, main, DISK_CACHE_NAME
 except ImportError:
     print("Error: Please ensure wiki_tracker.py is in the same directory")
     sys.exit(1)
@@ -23,6 +25,21 @@ class TestWikipediaEditTracker(unittest.TestCase):
         """Test initialization of WikipediaEditTracker."""
         self.assertIsInstance(self.tracker.session, requests.Session)
         self.assertIn('User-Agent', self.tracker.session.headers)
+        
+        retries = self.tracker.session.get_adapter(WikipediaEditTracker.BASE_URL).max_retries
+        self.assertEqual(retries.total, 3)
+        self.assertIn(503, retries.status_forcelist)
+    
+    @patch('wiki_tracker.CachedSession')
+    def test_init_with_disk_cache(self, mock_cached_session):
+        """Test that a named tracker uses a persistent response cache."""
+        tracker = WikipediaEditTracker(cache_name='test_cache')
+        
+        mock_cached_session.assert_called_once_with(
+            'test_cache', backend='sqlite',
+            expire_after=WikipediaEditTracker.CACHE_EXPIRE_AFTER
+        )
+        self.assertIs(tracker.session, mock_cached_session.return_value)
     
     def test_format_timestamp(self):
         """Test timestamp formatting."""
@@ -31,6 +48,10 @@ class TestWikipediaEditTracker(unittest.TestCase):
         result = self.tracker.format_timestamp(timestamp)
         self.assertEqual(result, "2023-09-23 17:28:39")
         
+        # Test timestamp with an explicit offset (falls back to parsing)
+        result = self.tracker.format_timestamp("2023-09-23T17:28:39+00:00")
+        self.assertEqual(result, "2023-09-23 17:28:39")
+        
         # Test invalid timestamp (should return original)
         invalid_timestamp = "invalid-timestamp"
         result = self.tracker.format_timestamp(invalid_timestamp)
@@ -42,8 +63,8 @@ class TestWikipediaEditTracker(unittest.TestCase):
         # Mock response data
         mock_response_data = {
             "query": {
-                "pages": {
-                    "12345": {
+                "pages": [
+                    {
                         "pageid": 12345,
                         "title": "Test Page",
                         "revisions": [
@@ -57,21 +78,56 @@ class TestWikipediaEditTracker(unittest.TestCase):
                             }
                         ]
                     }
-                }
+                ]
             }
         }
         
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
         revisions, redirect_title = self.tracker.get_page_revisions("Test Page")
         
+        params = mock_get.call_args[1]['params']
+        self.assertEqual(params['formatversion'], 2)
+        self.assertEqual(params['rvprop'], 'timestamp|user')
         self.assertEqual(len(revisions), 2)
         self.assertEqual(revisions[0]['user'], 'TestUser1')
         self.assertIsNone(redirect_title)
     
+    @patch('requests.Session.get')
+    def test_get_page_revisions_formatversion_1(self, mock_get):
+        """Test page revision retrieval with a legacy formatversion 1 response."""
+        mock_response_data = {
+            "query": {
+                "pages": {
+                    "12345": {
+                        "pageid": 12345,
+                        "title": "Test Page",
+                        "revisions": [
+                            {
+                                "user": "TestUser1",
+                                "timestamp": "2023-09-23T17:28:39Z"
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+        
+        mock_response = Mock()
+        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        revisions, redirect_title = self.tracker.get_page_revisions("Test Page")
+        
+        self.assertEqual(revisions[0]['user'], 'TestUser1')
+        self.assertIsNone(redirect_title)
+    
     @patch('requests.Session.get')
     def test_get_page_revisions_with_redirect(self, mock_get):
         """Test page revision retrieval with redirect."""
@@ -80,8 +136,8 @@ class TestWikipediaEditTracker(unittest.TestCase):
                 "redirects": [
                     {"from": "Old Name", "to": "New Name"}
                 ],
-                "pages": {
-                    "12345": {
+                "pages": [
+                    {
                         "pageid": 12345,
                         "title": "New Name",
                         "revisions": [
@@ -91,12 +147,13 @@ class TestWikipediaEditTracker(unittest.TestCase):
                             }
                         ]
                     }
-                }
+                ]
             }
         }
         
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -110,18 +167,19 @@ class TestWikipediaEditTracker(unittest.TestCase):
         """Test handling of non-existent pages."""
         mock_response_data = {
             "query": {
-                "pages": {
-                    "-1": {
+                "pages": [
+                    {
                         "ns": 0,
                         "title": "NonExistentPage",
-                        "missing": ""
+                        "missing": True
                     }
-                }
+                ]
             }
         }
         
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -152,6 +210,7 @@ class TestWikipediaEditTracker(unittest.TestCase):
         
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -160,13 +219,143 @@ class TestWikipediaEditTracker(unittest.TestCase):
         
         self.assertIn("API error", str(context.exception))
     
+    @patch('requests.Session.get')
+    def test_get_page_revisions_invalid_json(self, mock_get):
+        """Test handling of undecodable API responses."""
+        mock_response = Mock()
+        mock_response.json.side_effect = json.JSONDecodeError("Expecting value", "", 0)
+        mock_response.content = b"<html>not json</html>"
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        with self.assertRaises(ValueError) as context:
+            self.tracker.get_page_revisions("Test Page")
+        
+        self.assertIn("Invalid response", str(context.exception))
+    
+    @patch('requests.Session.get')
+    def test_get_page_revisions_cached(self, mock_get):
+        """Test that repeated lookups are served from the cache."""
+        mock_response_data = {
+            "query": {
+                "pages": [
+                    {
+                        "pageid": 12345,
+                        "title": "Test Page",
+                        "revisions": [
+                            {
+                                "user": "TestUser1",
+                                "timestamp": "2023-09-23T17:28:39Z"
+                            }
+                        ]
+                    }
+                ]
+            }
+        }
+        
+        mock_response = Mock()
+        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        first = self.tracker.get_page_revisions("Test Page")
+        second = self.tracker.get_page_revisions("test_Page")
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+        
+        # Only the first character is case-insensitive on Wikipedia
+        self.tracker.get_page_revisions("Test page")
+        self.assertEqual(mock_get.call_count, 2)
+        
+        self.tracker.cache_clear()
+        self.tracker.get_page_revisions("Test Page")
+        self.assertEqual(mock_get.call_count, 3)
+    
+    @patch('requests.Session.get')
+    def test_get_many_page_revisions(self, mock_get):
+        """Test batched revision retrieval for several pages."""
+        mock_response_data = {
+            "query": {
+                "normalized": [
+                    {"from": "test page", "to": "Test page"}
+                ],
+                "redirects": [
+                    {"from": "Old Name", "to": "New Name"}
+                ],
+                "pages": [
+                    {
+                        "pageid": 12345,
+                        "title": "Test page",
+                        "revisions": [
+                            {
+                                "user": "TestUser1",
+                                "timestamp": "2023-09-23T17:28:39Z"
+                            }
+                        ]
+                    },
+                    {
+                        "pageid": 67890,
+                        "title": "New Name",
+                        "revisions": [
+                            {
+                                "user": "TestUser2",
+                                "timestamp": "2023-09-22T15:30:00Z"
+                            }
+                        ]
+                    },
+                    {
+                        "ns": 0,
+                        "title": "NonExistentPage",
+                        "missing": True
+                    }
+                ]
+            }
+        }
+        
+        mock_response = Mock()
+        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        results = self.tracker.get_many_page_revisions(
+            ["test page", "Old Name", "NonExistentPage"]
+        )
+        
+        mock_get.assert_called_once()
+        params = mock_get.call_args[1]['params']
+        self.assertEqual(params['titles'], "test page|Old Name|NonExistentPage")
+        self.assertEqual(params['formatversion'], 2)
+        self.assertNotIn('rvlimit', params)
+        self.assertEqual(results["test page"][0][0]['user'], 'TestUser1')
+        self.assertIsNone(results["test page"][1])
+        self.assertEqual(results["Old Name"][0][0]['user'], 'TestUser2')
+        self.assertEqual(results["Old Name"][1], "New Name")
+        self.assertNotIn("NonExistentPage", results)
+    
+    @patch('requests.Session.get')
+    def test_get_many_page_revisions_batches(self, mock_get):
+        """Test that large title lists are split into API-sized batches."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"query": {"pages": []}}
+        mock_response.content = b'{"query": {"pages": []}}'
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        titles = [f"Page {i}" for i in range(WikipediaEditTracker.BATCH_SIZE + 1)]
+        self.tracker.get_many_page_revisions(titles)
+        
+        self.assertEqual(mock_get.call_count, 2)
+    
     @patch('requests.Session.get')
     def test_run_success(self, mock_get):
         """Test successful run method."""
         mock_response_data = {
             "query": {
-                "pages": {
-                    "12345": {
+                "pages": [
+                    {
                         "pageid": 12345,
                         "title": "Test Page",
                         "revisions": [
@@ -176,12 +365,13 @@ class TestWikipediaEditTracker(unittest.TestCase):
                             }
                         ]
                     }
-                }
+                ]
             }
         }
         
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -199,6 +389,45 @@ class TestWikipediaEditTracker(unittest.TestCase):
         finally:
             sys.stdout = old_stdout
     
+    @patch('requests.Session.get')
+    def test_run_hidden_user(self, mock_get):
+        """Test run method with a revision whose user is hidden."""
+        mock_response_data = {
+            "query": {
+                "pages": [
+                    {
+                        "pageid": 12345,
+                        "title": "Test Page",
+                        "revisions": [
+                            {
+                                "userhidden": True,
+                                "timestamp": "2023-09-23T17:28:39Z"
+                            }
+                        ]
+                    }
+                ]
+            }
+        }
+        
+        mock_response = Mock()
+        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        # Capture stdout
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+        
+        try:
+            result = self.tracker.run("Test Page")
+            output = captured_output.getvalue()
+            
+            self.assertEqual(result, 0)
+            self.assertEqual(output, "2023-09-23 17:28:39 Unknown\n")
+        finally:
+            sys.stdout = old_stdout
+    
     @patch('requests.Session.get')
     def test_run_with_redirect(self, mock_get):
         """Test run method with redirect."""
@@ -207,8 +436,8 @@ class TestWikipediaEditTracker(unittest.TestCase):
                 "redirects": [
                     {"from": "Old Name", "to": "New Name"}
                 ],
-                "pages": {
-                    "12345": {
+                "pages": [
+                    {
                         "pageid": 12345,
                         "title": "New Name",
                         "revisions": [
@@ -218,12 +447,13 @@ class TestWikipediaEditTracker(unittest.TestCase):
                             }
                         ]
                     }
-                }
+                ]
             }
         }
         
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -245,18 +475,19 @@ class TestWikipediaEditTracker(unittest.TestCase):
         """Test run method with non-existent page."""
         mock_response_data = {
             "query": {
-                "pages": {
-                    "-1": {
+                "pages": [
+                    {
                         "ns": 0,
                         "title": "NonExistentPage",
-                        "missing": ""
+                        "missing": True
                     }
-                }
+                ]
             }
         }
         
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -270,6 +501,205 @@ class TestWikipediaEditTracker(unittest.TestCase):
         
         result = self.tracker.run("Test Page")
         self.assertEqual(result, 3)
+    
+    @patch('wiki_tracker.aiohttp')
+    def test_run_many_concurrent(self, mock_aiohttp):
+        """Test run_many fetching pages through the async session."""
+        async def fake_get(session, page_title, limit=30):
+            if page_title == "Missing Page":
+                raise ValueError("Page not found")
+            return [{"user": f"{page_title} User", "timestamp": "2023-09-23T17:28:39Z"}], None
+        
+        # Capture stdout
+        old_stdout, old_stderr = sys.stdout, sys.stderr
+        sys.stdout = captured_output = StringIO()
+        sys.stderr = StringIO()
+        
+        try:
+            with patch.object(self.tracker, 'get_page_revisions_async', side_effect=fake_get):
+                result = asyncio.run(self.tracker.run_many(["Page A", "Missing Page", "Page B"]))
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout, sys.stderr = old_stdout, old_stderr
+        
+        self.assertEqual(result, 2)
+        self.assertEqual(output, "== Page A ==\n2023-09-23 17:28:39 Page A User\n"
+                                 "== Missing Page ==\n"
+                                 "== Page B ==\n2023-09-23 17:28:39 Page B User\n")
+        mock_aiohttp.ClientSession.return_value.__aexit__.assert_awaited_once()
+    
+    def _mock_async_session(self, *responses):
+        """Build an async session whose get() yields the given responses in order."""
+        contexts = []
+        for response in responses:
+            context = MagicMock()
+            if isinstance(response, Exception):
+                context.__aenter__ = AsyncMock(side_effect=response)
+            else:
+                context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            contexts.append(context)
+        
+        session = MagicMock()
+        session.get.side_effect = contexts
+        return session
+    
+    def _mock_async_response(self, status=200, body=b"", headers=None):
+        """Build an aiohttp-style response with the given status and body."""
+        response = Mock()
+        response.status = status
+        response.headers = headers or {}
+        response.read = AsyncMock(return_value=body)
+        return response
+    
+    def _fake_aiohttp(self):
+        """Stand-in for the aiohttp module with real exception classes."""
+        class ClientError(Exception):
+            pass
+        
+        class ClientResponseError(ClientError):
+            pass
+        
+        fake = MagicMock()
+        fake.ClientError = ClientError
+        fake.ClientResponseError = ClientResponseError
+        return fake
+    
+    def test_get_page_revisions_async_success(self):
+        """Test async revision retrieval and its use of the cache."""
+        body = json.dumps({
+            "query": {
+                "redirects": [
+                    {"from": "Old Name", "to": "New Name"}
+                ],
+                "pages": [
+                    {
+                        "pageid": 12345,
+                        "title": "New Name",
+                        "revisions": [
+                            {
+                                "user": "TestUser1",
+                                "timestamp": "2023-09-23T17:28:39Z"
+                            }
+                        ]
+                    }
+                ]
+            }
+        }).encode()
+        session = self._mock_async_session(self._mock_async_response(body=body))
+        
+        with patch('wiki_tracker.aiohttp', self._fake_aiohttp()):
+            revisions, redirect_title = asyncio.run(
+                self.tracker.get_page_revisions_async(session, "Old Name"))
+            cached = asyncio.run(self.tracker.get_page_revisions_async(session, "Old Name"))
+        
+        self.assertEqual(revisions[0]['user'], 'TestUser1')
+        self.assertEqual(redirect_title, "New Name")
+        self.assertEqual(cached, (revisions, redirect_title))
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(session.get.call_args[1]['params']['titles'], "Old Name")
+    
+    def test_get_page_revisions_async_invalid_json(self):
+        """Test async handling of undecodable API responses."""
+        session = self._mock_async_session(self._mock_async_response(body=b"<html>not json</html>"))
+        
+        with patch('wiki_tracker.aiohttp', self._fake_aiohttp()):
+            with self.assertRaises(ValueError) as context:
+                asyncio.run(self.tracker.get_page_revisions_async(session, "Test Page"))
+        
+        self.assertIn("Invalid response", str(context.exception))
+    
+    @patch('wiki_tracker.asyncio.sleep', new_callable=AsyncMock)
+    def test_get_page_revisions_async_client_error(self, mock_sleep):
+        """Test that persistent client errors are retried, then raised as RequestException."""
+        fake_aiohttp = self._fake_aiohttp()
+        error = fake_aiohttp.ClientError("Connection failed")
+        session = self._mock_async_session(*[error] * (WikipediaEditTracker.RETRY_TOTAL + 1))
+        
+        with patch('wiki_tracker.aiohttp', fake_aiohttp):
+            with self.assertRaises(requests.RequestException) as context:
+                asyncio.run(self.tracker.get_page_revisions_async(session, "Test Page"))
+        
+        self.assertIn("Network error", str(context.exception))
+        self.assertEqual(session.get.call_count, WikipediaEditTracker.RETRY_TOTAL + 1)
+        self.assertEqual(mock_sleep.await_count, WikipediaEditTracker.RETRY_TOTAL)
+    
+    @patch('wiki_tracker.asyncio.sleep', new_callable=AsyncMock)
+    def test_get_page_revisions_async_retries_status(self, mock_sleep):
+        """Test that a retryable status is retried before succeeding."""
+        body = b'{"query": {"pages": [{"title": "Test Page", "revisions": []}]}}'
+        session = self._mock_async_session(self._mock_async_response(status=503),
+                                           self._mock_async_response(body=body))
+        
+        with patch('wiki_tracker.aiohttp', self._fake_aiohttp()):
+            revisions, redirect_title = asyncio.run(
+                self.tracker.get_page_revisions_async(session, "Test Page"))
+        
+        self.assertEqual(revisions, [])
+        self.assertEqual(session.get.call_count, 2)
+        mock_sleep.assert_awaited_once_with(WikipediaEditTracker.RETRY_BACKOFF)
+    
+    @patch('wiki_tracker.asyncio.sleep', new_callable=AsyncMock)
+    def test_get_page_revisions_async_honors_retry_after(self, mock_sleep):
+        """Test that a Retry-After header overrides the backoff delay."""
+        body = b'{"query": {"pages": [{"title": "Test Page", "revisions": []}]}}'
+        session = self._mock_async_session(
+            self._mock_async_response(status=429, headers={'Retry-After': '7'}),
+            self._mock_async_response(body=body))
+        
+        with patch('wiki_tracker.aiohttp', self._fake_aiohttp()):
+            asyncio.run(self.tracker.get_page_revisions_async(session, "Test Page"))
+        
+        mock_sleep.assert_awaited_once_with(7.0)
+    
+    @patch('wiki_tracker.asyncio.sleep', new_callable=AsyncMock)
+    def test_get_page_revisions_async_retries_exhausted(self, mock_sleep):
+        """Test that a retryable status on the last attempt raises RequestException."""
+        responses = [self._mock_async_response(status=503)
+                     for _ in range(WikipediaEditTracker.RETRY_TOTAL + 1)]
+        session = self._mock_async_session(*responses)
+        
+        with patch('wiki_tracker.aiohttp', self._fake_aiohttp()):
+            with self.assertRaises(requests.RequestException) as context:
+                asyncio.run(self.tracker.get_page_revisions_async(session, "Test Page"))
+        
+        self.assertIn("HTTP 503", str(context.exception))
+        self.assertEqual(session.get.call_count, WikipediaEditTracker.RETRY_TOTAL + 1)
+        for response in responses:
+            response.read.assert_not_awaited()
+    
+    def test_retry_after(self):
+        """Test parsing of Retry-After header values."""
+        self.assertIsNone(WikipediaEditTracker._retry_after(None))
+        self.assertEqual(WikipediaEditTracker._retry_after("5"), 5.0)
+        self.assertEqual(WikipediaEditTracker._retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(WikipediaEditTracker._retry_after("soon"))
+    
+    @patch('wiki_tracker.aiohttp', None)
+    def test_get_page_revisions_async_without_aiohttp(self):
+        """Test that the async lookup fails clearly when aiohttp is missing."""
+        with self.assertRaises(RuntimeError) as context:
+            asyncio.run(self.tracker.get_page_revisions_async(MagicMock(), "Test Page"))
+        
+        self.assertIn("aiohttp", str(context.exception))
+    
+    @patch('wiki_tracker.aiohttp', None)
+    @patch('requests.Session.get')
+    def test_run_many_without_aiohttp(self, mock_get):
+        """Test run_many falling back to sequential requests."""
+        mock_get.side_effect = requests.RequestException("Connection failed")
+        
+        old_stdout, old_stderr = sys.stdout, sys.stderr
+        sys.stdout = StringIO()
+        sys.stderr = StringIO()
+        
+        try:
+            result = asyncio.run(self.tracker.run_many(["Page A", "Page B"]))
+        finally:
+            sys.stdout, sys.stderr = old_stdout, old_stderr
+        
+        self.assertEqual(result, 3)
+        self.assertEqual(mock_get.call_count, 2)
 
 
 class TestMainFunction(unittest.TestCase):
@@ -292,6 +722,28 @@ class TestMainFunction(unittest.TestCase):
         self.assertEqual(result, 0)
         mock_run.assert_called_once_with('Test Page')
     
+    @patch('sys.argv', ['wiki_tracker.py', 'Test Page'])
+    @patch('wiki_tracker.WikipediaEditTracker')
+    def test_main_uses_home_disk_cache(self, mock_tracker):
+        """Test that the CLI keeps its disk cache under ~/.cache."""
+        mock_tracker.return_value.run.return_value = 0
+        
+        main()
+        
+        mock_tracker.assert_called_once_with(cache_name=DISK_CACHE_NAME)
+        self.assertTrue(DISK_CACHE_NAME.startswith(os.path.expanduser('~')))
+    
+    @patch('sys.argv', ['wiki_tracker.py', 'Page A', 'Page B'])
+    @patch('wiki_tracker.WikipediaEditTracker.run_many')
+    def test_main_with_several_arguments(self, mock_run_many):
+        """Test main function with several article names."""
+        mock_run_many.return_value = 0
+        
+        result = main()
+        
+        self.assertEqual(result, 0)
+        mock_run_many.assert_called_once_with(['Page A', 'Page B'])
+    
     @patch('sys.argv', ['wiki_tracker.py', ''])
     def test_main_empty_argument(self):
         """Test main function with empty argument."""
@@ -1,25 +1,89 @@
+import asyncio
+import os
 import sys
 import requests
 import json
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+DISK_CACHE_NAME = os.path.join(os.path.expanduser('~/.cache'), 'wiki_tracker')
+
 
 class WikipediaEditTracker:
     """Main class for tracking Wikipedia edits."""
     
     BASE_URL = "https://en.wikipedia.org/w/api.php"
+    USER_AGENT = 'WikipediaEditTracker/1.0 (Educational Project)'
+    CACHE_SIZE = 256
+    BATCH_SIZE = 50
+    CACHE_EXPIRE_AFTER = 300
+    MAX_CONCURRENCY = 8
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache_name: Optional[str] = None):
+        """
+        Args:
+            cache_name: Name of an on-disk SQLite response cache shared between
+                runs (requires requests-cache). No disk cache is used if None.
+        """
+        if cache_name and CachedSession is not None:
+            self.session = CachedSession(cache_name, backend='sqlite',
+                                         expire_after=self.CACHE_EXPIRE_AFTER)
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'WikipediaEditTracker/1.0 (Educational Project)'
+            'User-Agent': self.USER_AGENT
         })
+        retry = Retry(total=self.RETRY_TOTAL, backoff_factor=self.RETRY_BACKOFF,
+                      status_forcelist=self.RETRY_STATUSES,
+                      allowed_methods=["GET"])
+        self.session.mount('https://', HTTPAdapter(max_retries=retry,
+                                                   pool_connections=4, pool_maxsize=16))
+        self._cache = OrderedDict()
+    
+    def cache_clear(self) -> None:
+        """Discard all cached page revisions."""
+        self._cache.clear()
+    
+    @staticmethod
+    def _title_key(page_title: str) -> str:
+        """
+        Normalize a title the way MediaWiki does for cache lookups.
+        
+        Underscores and spaces are equivalent and only the first character is
+        case-insensitive; the rest of the title is case-sensitive.
+        """
+        title = ' '.join(page_title.replace('_', ' ').split())
+        return title[:1].upper() + title[1:]
     
     def get_page_revisions(self, page_title: str, limit: int = 30) -> Tuple[List[Dict], Optional[str]]:
         """
         Retrieve recent revisions for a Wikipedia page.
         
+        Results are cached per (normalized title, limit), so repeated
+        lookups of the same page skip the network round trip.
+        
         Args:
             page_title: The title of the Wikipedia page
             limit: Maximum number of revisions to retrieve (default: 30)
@@ -31,33 +95,149 @@ class WikipediaEditTracker:
             requests.RequestException: For network errors
             ValueError: For invalid page titles or API errors
         """
-        params = {
+        key = (self._title_key(page_title), limit)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        
+        result = self._fetch_page_revisions(page_title, limit)
+        self._cache_put(key, result)
+        return result
+    
+    async def get_page_revisions_async(self, session: 'aiohttp.ClientSession', page_title: str,
+                                       limit: int = 30) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Asynchronous counterpart of get_page_revisions (requires aiohttp).
+        
+        Shares the in-memory LRU cache. Connection errors and RETRY_STATUSES
+        responses are retried up to RETRY_TOTAL times, waiting
+        RETRY_BACKOFF * 2**n seconds or as long as a Retry-After header asks.
+        The on-disk requests-cache is not used on this path.
+        
+        Args:
+            session: The aiohttp session to send the request through
+            page_title: The title of the Wikipedia page
+            limit: Maximum number of revisions to retrieve (default: 30)
+            
+        Returns:
+            Tuple of (revisions_list, redirect_title)
+            
+        Raises:
+            RuntimeError: If aiohttp is not installed
+            requests.RequestException: For network errors
+            ValueError: For invalid page titles or API errors
+        """
+        if aiohttp is None:
+            raise RuntimeError("get_page_revisions_async requires aiohttp")
+        
+        key = (self._title_key(page_title), limit)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        
+        params = self._revision_params(page_title, limit)
+        delay = 0.0
+        for attempt in range(self.RETRY_TOTAL + 1):
+            if attempt:
+                await asyncio.sleep(delay)
+            delay = self.RETRY_BACKOFF * 2 ** attempt
+            try:
+                async with session.get(self.BASE_URL, params=params,
+                                       timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    if response.status in self.RETRY_STATUSES:
+                        if attempt == self.RETRY_TOTAL:
+                            raise requests.RequestException(
+                                f"Network error: HTTP {response.status} after {self.RETRY_TOTAL} retries")
+                        retry_after = self._retry_after(response.headers.get('Retry-After'))
+                        if retry_after is not None:
+                            delay = retry_after
+                        continue
+                    response.raise_for_status()
+                    body = await response.read()
+                break
+            except aiohttp.ClientResponseError as e:
+                raise requests.RequestException(f"Network error: {e}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.RETRY_TOTAL:
+                    raise requests.RequestException(f"Network error: {e}")
+        
+        try:
+            data = orjson.loads(body) if orjson else json.loads(body)
+        except json.JSONDecodeError:
+            raise ValueError("Invalid response from Wikipedia API")
+        
+        self._check_api_error(data)
+        result = self._parse_page_revisions(data)
+        self._cache_put(key, result)
+        return result
+    
+    @staticmethod
+    def _retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header (seconds or HTTP date) into a delay in seconds."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    
+    def _cache_put(self, key: Tuple[str, int], result: Tuple[List[Dict], Optional[str]]) -> None:
+        """Store a result in the LRU cache, evicting the oldest entry if full."""
+        self._cache[key] = result
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    def _fetch_page_revisions(self, page_title: str, limit: int) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Query the Wikipedia API for recent revisions of a page.
+        
+        Args:
+            page_title: The title of the Wikipedia page
+            limit: Maximum number of revisions to retrieve
+            
+        Returns:
+            Tuple of (revisions_list, redirect_title)
+            
+        Raises:
+            requests.RequestException: For network errors
+            ValueError: For invalid page titles or API errors
+        """
+        data = self._query(self._revision_params(page_title, limit))
+        return self._parse_page_revisions(data)
+    
+    def _revision_params(self, page_title: str, limit: int) -> Dict:
+        """Build the API query parameters for a single page's revisions."""
+        return {
             'action': 'query',
             'format': 'json',
+            'formatversion': 2,
             'prop': 'revisions',
             'titles': page_title,
             'rvprop': 'timestamp|user',
             'rvlimit': limit,
             'redirects': 1
         }
+    
+    def _parse_page_revisions(self, data: Dict) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Extract the revisions and redirect target from a single-page response.
         
-        try:
-            response = self.session.get(self.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            raise requests.RequestException(f"Network error: {e}")
-        
-        try:
-            data = response.json()
-        except json.JSONDecodeError:
-            raise ValueError("Invalid response from Wikipedia API")
-        
-        # Check for API errors
-        if 'error' in data:
-            error_code = data['error'].get('code', 'unknown')
-            error_info = data['error'].get('info', 'Unknown error')
-            raise ValueError(f"API error ({error_code}): {error_info}")
-        
+        Args:
+            data: The decoded JSON response
+            
+        Returns:
+            Tuple of (revisions_list, redirect_title)
+            
+        Raises:
+            ValueError: If the page is missing or the response has no page data
+        """
         # Check for redirects
         redirect_title = None
         if 'redirects' in data.get('query', {}):
@@ -65,14 +245,14 @@ class WikipediaEditTracker:
             if redirects:
                 redirect_title = redirects[0]['to']
         
-        # Extract page data
-        pages = data.get('query', {}).get('pages', {})
+        # Extract page data (a list in formatversion 2, keyed by page ID in version 1)
+        pages = data.get('query', {}).get('pages', [])
         
         if not pages:
             raise ValueError("No page data found")
         
         # Get the first (and should be only) page
-        page_data = next(iter(pages.values()))
+        page_data = pages[0] if isinstance(pages, list) else next(iter(pages.values()))
         
         # Check if page exists
         if 'missing' in page_data:
@@ -83,6 +263,89 @@ class WikipediaEditTracker:
         
         return revisions, redirect_title
     
+    def get_many_page_revisions(self, page_titles: List[str]) -> Dict[str, Tuple[List[Dict], Optional[str]]]:
+        """
+        Retrieve the latest revision for several Wikipedia pages at once.
+        
+        Titles are sent in batches of up to BATCH_SIZE per request. The API
+        only allows rvlimit for single-page queries, so each page comes back
+        with its most recent revision only. This is meant for library callers
+        that only need each page's latest edit; the CLI shows up to 30
+        revisions per page, so it uses run/run_many instead.
+        
+        Args:
+            page_titles: The titles of the Wikipedia pages
+            
+        Returns:
+            Dict mapping each requested title to (revisions_list, redirect_title).
+            Titles that do not exist are left out.
+            
+        Raises:
+            requests.RequestException: For network errors
+            ValueError: For API errors
+        """
+        results = {}
+        
+        for start in range(0, len(page_titles), self.BATCH_SIZE):
+            batch = page_titles[start:start + self.BATCH_SIZE]
+            params = self._revision_params('|'.join(batch), limit=1)
+            del params['rvlimit']
+            
+            query = self._query(params).get('query', {})
+            normalized = {n['from']: n['to'] for n in query.get('normalized', [])}
+            redirects = {r['from']: r['to'] for r in query.get('redirects', [])}
+            pages = query.get('pages', [])
+            if isinstance(pages, dict):
+                pages = pages.values()
+            pages = {page['title']: page for page in pages}
+            
+            for title in batch:
+                resolved = normalized.get(title, title)
+                redirect_title = redirects.get(resolved)
+                page_data = pages.get(redirect_title or resolved)
+                
+                if page_data is None or 'missing' in page_data:
+                    continue
+                
+                results[title] = (page_data.get('revisions', []), redirect_title)
+        
+        return results
+    
+    def _query(self, params: Dict) -> Dict:
+        """
+        Send a query to the Wikipedia API and decode the response.
+        
+        Args:
+            params: Query string parameters for the API request
+            
+        Returns:
+            The decoded JSON response
+            
+        Raises:
+            requests.RequestException: For network errors
+            ValueError: For invalid responses or API errors
+        """
+        try:
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise requests.RequestException(f"Network error: {e}")
+        
+        try:
+            data = orjson.loads(response.content) if orjson else response.json()
+        except json.JSONDecodeError:
+            raise ValueError("Invalid response from Wikipedia API")
+        
+        self._check_api_error(data)
+        return data
+    
+    def _check_api_error(self, data: Dict) -> None:
+        """Raise ValueError if the decoded response reports an API error."""
+        if 'error' in data:
+            error_code = data['error'].get('code', 'unknown')
+            error_info = data['error'].get('info', 'Unknown error')
+            raise ValueError(f"API error ({error_code}): {error_info}")
+    
     def format_timestamp(self, timestamp: str) -> str:
         """
         Format ISO timestamp to a more readable format.
@@ -93,6 +356,10 @@ class WikipediaEditTracker:
         Returns:
             Formatted timestamp string
         """
+        # MediaWiki always returns 'YYYY-MM-DDTHH:MM:SSZ', so slice it directly
+        if len(timestamp) == 20 and timestamp[10] == 'T' and timestamp[-1] == 'Z':
+            return timestamp[:10] + ' ' + timestamp[11:19]
+        
         try:
             dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
             return dt.strftime('%Y-%m-%d %H:%M:%S')
@@ -111,47 +378,108 @@ class WikipediaEditTracker:
         """
         try:
             revisions, redirect_title = self.get_page_revisions(page_title)
+        except (ValueError, requests.RequestException) as e:
+            return self._report_error(page_title, e)
+        
+        self._print_revisions(revisions, redirect_title)
+        return 0
+    
+    async def run_many(self, page_titles: List[str]) -> int:
+        """
+        Execution method for several pages, fetched concurrently.
+        
+        Up to MAX_CONCURRENCY requests are in flight at once. Without aiohttp
+        the pages are fetched one after another. Requests made through aiohttp
+        are retried like sync ones but skip the on-disk response cache.
+        
+        Args:
+            page_titles: Wikipedia page titles to analyze
             
-            # Print redirect message if applicable
-            if redirect_title:
-                print(f"Redirected to {redirect_title}")
-            
-            # Print revisions in reverse chronological order (already sorted by API)
-            for revision in revisions:
-                timestamp = self.format_timestamp(revision['timestamp'])
-                user = revision.get('user', 'Unknown')
-                print(f"{timestamp} {user}")
-            
-            return 0
-            
-        except ValueError as e:
-            if "Page not found" in str(e):
+        Returns:
+            The highest exit code of any page (see run)
+        """
+        if aiohttp is None:
+            outcomes = [self._revisions_or_error(title) for title in page_titles]
+        else:
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+            async with aiohttp.ClientSession(headers={'User-Agent': self.USER_AGENT}) as session:
+                outcomes = await asyncio.gather(
+                    *(self._revisions_or_error_async(session, title, semaphore)
+                      for title in page_titles)
+                )
+        
+        exit_code = 0
+        for page_title, outcome in zip(page_titles, outcomes):
+            print(f"== {page_title} ==")
+            if isinstance(outcome, Exception):
+                exit_code = max(exit_code, self._report_error(page_title, outcome))
+            else:
+                self._print_revisions(*outcome)
+        return exit_code
+    
+    def _revisions_or_error(self, page_title: str):
+        """Return the page's revisions, or the error raised fetching them."""
+        try:
+            return self.get_page_revisions(page_title)
+        except (ValueError, requests.RequestException) as e:
+            return e
+    
+    async def _revisions_or_error_async(self, session: 'aiohttp.ClientSession', page_title: str,
+                                        semaphore: asyncio.Semaphore):
+        """Async version of _revisions_or_error, limited by semaphore."""
+        async with semaphore:
+            try:
+                return await self.get_page_revisions_async(session, page_title)
+            except (ValueError, requests.RequestException) as e:
+                return e
+    
+    def _print_revisions(self, revisions: List[Dict], redirect_title: Optional[str]) -> None:
+        """Print the redirect notice and one line per revision."""
+        # Redirect message first, if applicable
+        lines = [f"Redirected to {redirect_title}"] if redirect_title else []
+        
+        # Revisions in reverse chronological order (already sorted by API)
+        fmt = self.format_timestamp
+        lines.extend(
+            f"{fmt(revision['timestamp'])} {revision.get('user', 'Unknown')}"
+            for revision in revisions
+        )
+        
+        # Emit all lines with a single write
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+    
+    def _report_error(self, page_title: str, error: Exception) -> int:
+        """Print an error for page_title and return the matching exit code."""
+        if isinstance(error, ValueError):
+            if "Page not found" in str(error):
                 print(f"Error: No Wikipedia page found for '{page_title}'", file=sys.stderr)
                 return 2
             else:
-                print(f"Error: {e}", file=sys.stderr)
+                print(f"Error: {error}", file=sys.stderr)
                 return 3
-                
-        except requests.RequestException as e:
-            print(f"Network error: {e}", file=sys.stderr)
-            return 3
+        
+        print(f"Network error: {error}", file=sys.stderr)
+        return 3
 
 
 def main():
     """Main entry point for the application."""
-    if len(sys.argv) != 2:
-        print("Usage: python wiki_tracker.py <article_name>", file=sys.stderr)
+    if len(sys.argv) < 2:
+        print("Usage: python wiki_tracker.py <article_name> [<article_name> ...]", file=sys.stderr)
         print("Example: python wiki_tracker.py 'Ball State University'", file=sys.stderr)
         return 1
     
-    page_title = sys.argv[1]
+    page_titles = sys.argv[1:]
     
-    if not page_title.strip():
+    if not all(page_title.strip() for page_title in page_titles):
         print("Error: Article name cannot be empty", file=sys.stderr)
         return 1
     
-    tracker = WikipediaEditTracker()
-    return tracker.run(page_title)
+    tracker = WikipediaEditTracker(cache_name=DISK_CACHE_NAME)
+    if len(page_titles) == 1:
+        return tracker.run(page_titles[0])
+    return asyncio.run(tracker.run_many(page_titles))
 
 
 if __name__ == "__main__":